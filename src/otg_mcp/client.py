@@ -5,13 +5,14 @@ This simplified client provides a single entry point for traffic generator opera
 using snappi API directly, with proper target management and version detection.
 """
 
+import asyncio
 import logging
 import os
 import time
 import traceback
 import uuid
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import aiohttp
 import snappi  # type: ignore
@@ -30,7 +31,7 @@ from otg_mcp.models import (
     TrafficGeneratorInfo,
     TrafficGeneratorStatus,
 )
-from otg_mcp.schema_registry import SchemaRegistry
+from otg_mcp.schema_registry import SchemaRegistry, _normalize_version
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -47,6 +48,10 @@ class OtgClient:
 
     config: Config
     api_clients: Dict[str, Any] = field(default_factory=dict)
+    target_configs: Dict[str, Tuple[float, Dict[str, Any]]] = field(
+        default_factory=dict
+    )
+    target_config_ttl: float = 300.0
     schema_registry: Optional[SchemaRegistry] = field(default=None)
 
     def __post_init__(self):
@@ -937,7 +942,8 @@ class OtgClient:
         - API version information (when available)
         - Additional metadata
 
-        This method always clears the client cache to ensure fresh connections.
+        This method always clears the client cache and the cached target
+        configurations to ensure fresh connections and API versions.
 
         Returns:
             Dictionary mapping target names to their configurations, including:
@@ -949,51 +955,15 @@ class OtgClient:
 
         logger.info("Clearing client cache to force reconnection")
         self.api_clients.clear()
+        self.target_configs.clear()
 
         result = {}
         try:
             logger.info("Reading targets from config")
             for target_name, target_config in self.config.targets.targets.items():
-                logger.info(f"Processing target: {target_name}")
-
-                target_dict = {
-                    "ports": {},
-                    "available": False,
-                }
-
-                for port_name, port_config in target_config.ports.items():
-                    target_dict["ports"][port_name] = {  # type: ignore
-                        "location": port_config.location,
-                        "name": port_config.name,
-                    }
-
-                logger.info(f"Testing connection to {target_name}")
-                try:
-                    self._get_api_client(target_name)
-                    logger.debug("Testing availability of the target")
-                    target_dict["available"] = True
-                    logger.info(f"Target {target_name} is available")
-
-                    logger.info(
-                        f"Attempting to retrieve API version from target {target_name}"
-                    )
-                    try:
-                        version_info = await self.get_target_version(target_name)
-                        target_dict["apiVersion"] = version_info.sdk_version
-                        logger.info(
-                            f"Detected API version {version_info.sdk_version} for target {target_name}"
-                        )
-                    except Exception as version_error:
-                        logger.warning(
-                            f"Could not detect API version for {target_name}: {version_error}"
-                        )
-                        target_dict["apiVersionError"] = str(version_error)
-                except Exception as e:
-                    logger.warning(f"Error connecting to {target_name}: {e}")
-                    target_dict["available"] = False
-                    target_dict["error"] = str(e)
-
-                result[target_name] = target_dict  # type: ignore
+                result[target_name] = await self._describe_target(
+                    target_name, target_config
+                )
 
             logger.info(
                 f"Found {len(result)} targets, {sum(1 for t in result.values() if t['available'])} available"
@@ -1004,10 +974,72 @@ class OtgClient:
             logger.error(traceback.format_exc())
             return {}
 
+    async def _describe_target(
+        self, target_name: str, target_config: Any, detect_version: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Describe a configured target's ports and availability.
+
+        Args:
+            target_name: Name of the target
+            target_config: Configuration of the target
+            detect_version: Whether to query the target for its API version
+
+        Returns:
+            Dictionary with the target's ports, availability and, when
+            detected, its apiVersion or apiVersionError
+        """
+        logger.info(f"Processing target: {target_name}")
+
+        target_dict = {
+            "ports": {},
+            "available": False,
+        }
+
+        for port_name, port_config in target_config.ports.items():
+            target_dict["ports"][port_name] = {  # type: ignore
+                "location": port_config.location,
+                "name": port_config.name,
+            }
+
+        logger.info(f"Testing connection to {target_name}")
+        try:
+            self._get_api_client(target_name)
+            logger.debug("Testing availability of the target")
+            target_dict["available"] = True
+            logger.info(f"Target {target_name} is available")
+
+            if not detect_version:
+                return target_dict
+
+            logger.info(
+                f"Attempting to retrieve API version from target {target_name}"
+            )
+            try:
+                version_info = await self.get_target_version(target_name)
+                target_dict["apiVersion"] = version_info.sdk_version
+                logger.info(
+                    f"Detected API version {version_info.sdk_version} for target {target_name}"
+                )
+            except Exception as version_error:
+                logger.warning(
+                    f"Could not detect API version for {target_name}: {version_error}"
+                )
+                target_dict["apiVersionError"] = str(version_error)
+        except Exception as e:
+            logger.warning(f"Error connecting to {target_name}: {e}")
+            target_dict["available"] = False
+            target_dict["error"] = str(e)
+
+        return target_dict
+
     async def _get_target_config(self, target_name: str) -> Optional[Dict[str, Any]]:
         """
         Get configuration for a specific target (internal method).
 
+        Configurations with a detected API version are cached for
+        target_config_ttl seconds, so a target upgraded in place is re-probed.
+
         Args:
             target_name: Name of the target to look up
 
@@ -1015,14 +1047,25 @@ class OtgClient:
             Target configuration including ports and dynamically determined apiVersion,
             or None if the target doesn't exist
         """
+        cached = self.target_configs.get(target_name)
+        if cached is not None:
+            cached_at, cached_config = cached
+            if time.monotonic() - cached_at < self.target_config_ttl:
+                logger.debug("Using cached configuration for target %s", target_name)
+                return cached_config
+            logger.info("Cached configuration for target %s expired", target_name)
+            self.target_configs.pop(target_name, None)
+
         logger.info(f"Looking up configuration for target: {target_name}")
 
         try:
-            targets = await self.get_available_targets()
+            configured_target = self.config.targets.targets.get(target_name)
 
-            if target_name in targets:
+            if configured_target is not None:
                 logger.info(f"Found configuration for target: {target_name}")
-                target_config = targets[target_name]
+                target_config = await self._describe_target(
+                    target_name, configured_target, detect_version=False
+                )
                 schema_registry = self.schema_registry
 
                 logger.info(
@@ -1040,7 +1083,7 @@ class OtgClient:
                     )
                     version_info = await self.get_target_version(target_name)
                     actual_api_version = version_info.sdk_version
-                    normalized_version = actual_api_version.replace(".", "_")
+                    normalized_version = _normalize_version(actual_api_version)
 
                     logger.info(
                         f"Target {target_name} reports API version: {actual_api_version}"
@@ -1078,6 +1121,12 @@ class OtgClient:
                             f"Using closest matching version: {closest_version_dotted}"
                         )
                         target_config["apiVersion"] = closest_version_dotted
+
+                    logger.debug("Caching target configuration with detected version")
+                    self.target_configs[target_name] = (
+                        time.monotonic(),
+                        target_config,
+                    )
                 except Exception as e:
                     logger.info(
                         "Exception during API version detection, falling back to latest schema"
@@ -1291,7 +1340,7 @@ class OtgClient:
             if registry is None:
                 logger.error("Schema registry is not initialized")
                 raise ValueError("Schema registry is not initialized")
-            return registry.get_schema_components(api_version, path_prefix)
+            return list(registry.get_schema_components(api_version, path_prefix))
         except Exception as e:
             error_msg = (
                 f"Error getting schema components for target {target_name}: {str(e)}"
@@ -1299,6 +1348,34 @@ class OtgClient:
             logger.error(error_msg)
             raise ValueError(error_msg)
 
+    async def _check_target_health(self, target_name: str) -> TargetHealthInfo:
+        """
+        Check the health of a single target by requesting its version info.
+
+        Args:
+            target_name: Name of the target to check
+
+        Returns:
+            TargetHealthInfo: Health of the target, with the error if it is unhealthy
+        """
+        logger.info(f"Checking health for target: {target_name}")
+        try:
+            logger.info(f"Requesting version info from {target_name}")
+            version_info = await self.get_target_version(target_name)
+        except Exception as e:
+            logger.warning(f"Target {target_name} is unhealthy: {str(e)}")
+            return TargetHealthInfo(
+                name=target_name, healthy=False, error=str(e), version_info=None
+            )
+
+        logger.info(f"Target {target_name} is healthy")
+        return TargetHealthInfo(
+            name=target_name,
+            healthy=True,
+            version_info=version_info,
+            error=None,
+        )
+
     async def health(self, target: Optional[str] = None) -> HealthStatus:
         """
         Check health of traffic generator system by verifying version endpoints.
@@ -1320,33 +1397,17 @@ class OtgClient:
                 logger.info(f"Checking specific target: {target}")
                 target_names = [target]
             else:
-                logger.info("No specific target - checking all available targets")
-                targets = await self.get_available_targets()
-                target_names = list(targets.keys())
+                logger.info("No specific target - checking all configured targets")
+                target_names = list(self.config.targets.targets)
                 logger.info(f"Found {len(target_names)} targets to check")
 
-            logger.info("Beginning health checks for all targets")
-            all_targets_healthy = True
-            for target_name in target_names:
-                logger.info(f"Checking health for target: {target_name}")
-                try:
-                    logger.info(f"Requesting version info from {target_name}")
-                    version_info = await self.get_target_version(target_name)
-
-                    logger.info(f"Target {target_name} is healthy")
-                    health_status.targets[target_name] = TargetHealthInfo(
-                        name=target_name,
-                        healthy=True,
-                        version_info=version_info,
-                        error=None,
-                    )
-
-                except Exception as e:
-                    logger.warning(f"Target {target_name} is unhealthy: {str(e)}")
-                    health_status.targets[target_name] = TargetHealthInfo(
-                        name=target_name, healthy=False, error=str(e), version_info=None
-                    )
-                    all_targets_healthy = False
+            logger.info("Beginning concurrent health checks for all targets")
+            results = await asyncio.gather(
+                *(self._check_target_health(target_name) for target_name in target_names)
+            )
+            for target_info in results:
+                health_status.targets[target_info.name] = target_info
+            all_targets_healthy = all(target_info.healthy for target_info in results)
 
             if all_targets_healthy and target_names:
                 logger.info("All targets are healthy, setting status to 'success'")
@@ -1,9 +1,18 @@
+import functools
 import json
 import logging
 import os
-from typing import Dict, Optional
-
-from pydantic import BaseModel, ConfigDict, Field, validator, ValidationError
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
 from pydantic_settings import BaseSettings
 
 logging.basicConfig(
@@ -21,7 +30,8 @@ class LoggingConfig(BaseSettings):
         description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)",
     )
 
-    @validator("LOG_LEVEL")
+    @field_validator("LOG_LEVEL")
+    @classmethod
     def validate_log_level(cls, v: str) -> str:
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         upper_v = v.upper()
@@ -32,6 +42,12 @@ class LoggingConfig(BaseSettings):
         return upper_v
 
 
+@functools.lru_cache(maxsize=1)
+def _logging_config() -> LoggingConfig:
+    """Return the process-wide LoggingConfig, reading the environment once."""
+    return LoggingConfig()
+
+
 class PortConfig(BaseModel):
     """Configuration for a port on a traffic generator."""
 
@@ -43,22 +59,20 @@ class PortConfig(BaseModel):
         None, description="Interface name (backward compatibility)"
     )
 
-    @validator("location", pre=True, always=True)
-    def validate_location(cls, v, values):
-        """Validate location, using interface if location is not provided."""
-        if v is None and "interface" in values and values["interface"] is not None:
-            return values["interface"]
-        return v
-
-    @validator("name", pre=True, always=True)
-    def validate_name(cls, v, values):
-        """Validate name, using interface or location if name is not provided."""
-        if v is None:
-            if "interface" in values and values["interface"] is not None:
-                return values["interface"]
-            if "location" in values and values["location"] is not None:
-                return values["location"]
-        return v
+    @model_validator(mode="before")
+    @classmethod
+    def fill_location_and_name(cls, data: Any) -> Any:
+        """Default location to interface, and name to interface or location."""
+        if not isinstance(data, dict):
+            return data
+        interface = data.get("interface")
+        location = data.get("location")
+        if location is None and interface is not None:
+            location = interface
+        name = data.get("name")
+        if name is None:
+            name = interface if interface is not None else location
+        return {**data, "location": location, "name": name}
 
 
 class TargetConfig(BaseModel):
@@ -71,7 +85,7 @@ class TargetConfig(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
-class TargetsConfig(BaseSettings):
+class TargetsConfig(BaseModel):
     """Configuration for all available traffic generator targets."""
 
     targets: Dict[str, TargetConfig] = Field(
@@ -92,27 +106,29 @@ class Config:
     """Main configuration for the MCP server."""
 
     def __init__(self, config_file: Optional[str] = None):
-        self.logging = LoggingConfig()
+        self.logging = _logging_config()
         self.targets = TargetsConfig()
         self.schemas = SchemaConfig()
+        self._log_handler: Optional[logging.Handler] = None
 
         logger.info("Initializing configuration")
         if config_file:
             logger.info(f"Loading configuration from file: {config_file}")
             self.load_config_file(config_file)
-        elif not self.targets.targets:
+        else:
             logger.info("No targets defined - adding default development target")
-            example_target = TargetConfig(
-                ports={
-                    "p1": PortConfig(
-                        location="localhost:5555", name="p1", interface=None
-                    ),
-                    "p2": PortConfig(
-                        location="localhost:5555", name="p2", interface=None
-                    ),
+            self.targets = TargetsConfig.model_validate(
+                {
+                    "targets": {
+                        "localhost:8443": {
+                            "ports": {
+                                "p1": {"location": "localhost:5555", "name": "p1"},
+                                "p2": {"location": "localhost:5555", "name": "p2"},
+                            }
+                        }
+                    }
                 }
             )
-            self.targets.targets["localhost:8443"] = example_target
 
     def load_config_file(self, config_file_path: str) -> None:
         """
@@ -128,14 +144,9 @@ class Config:
         """
         logger.info(f"Loading traffic generator configuration from: {config_file_path}")
 
-        if not os.path.exists(config_file_path):
-            error_msg = f"Configuration file not found: {config_file_path}"
-            logger.critical(error_msg)
-            raise FileNotFoundError(error_msg)
-
         try:
-            with open(config_file_path, "r") as file:
-                config_data = json.load(file)
+            raw_config = Path(config_file_path).read_bytes()
+            config_data = json.loads(raw_config)
 
             logger.info("Validating configuration structure")
             if "targets" not in config_data:
@@ -143,35 +154,32 @@ class Config:
                 logger.critical(error_msg)
                 raise ValueError(error_msg)
 
-            logger.info("Clearing existing targets and initializing new configuration")
-            self.targets = TargetsConfig()
-
             logger.info("Processing each target in configuration")
+            targets: Dict[str, TargetConfig] = {}
             for hostname, target_data in config_data["targets"].items():
                 if not isinstance(target_data, dict) or "ports" not in target_data:
                     error_msg = f"Target '{hostname}' must contain a 'ports' dictionary"
                     logger.error(error_msg)
                     continue
 
-                logger.info(f"Creating target config for {hostname}")
-
-                logger.info("Validating target configuration using Pydantic model")
+                logger.debug("Validating target configuration for %s", hostname)
                 try:
-                    target_config = TargetConfig(**target_data)
+                    target_config = TargetConfig.model_validate(target_data)
                 except ValidationError as e:
-                    error_msg = (
-                        f"Invalid target configuration for '{hostname}': {str(e)}"
-                    )
+                    error_msg = f"Invalid target configuration for '{hostname}': {e}"
                     logger.error(error_msg)
-                    if "extra fields not permitted" in str(e):
+                    if any(err["type"] == "extra_forbidden" for err in e.errors()):
                         logger.error(
                             "The configuration contains fields that are not allowed. "
                             "apiVersion should not be included in target configuration."
                         )
                     continue
 
-                logger.info(f"Adding target {hostname} to configuration")
-                self.targets.targets[hostname] = target_config
+                logger.debug("Adding target %s to configuration", hostname)
+                targets[hostname] = target_config
+
+            logger.info("Replacing existing targets with the loaded configuration")
+            self.targets = TargetsConfig(targets=targets)
 
             logger.info("Checking for schema path in configuration")
             if "schema_path" in config_data:
@@ -186,9 +194,15 @@ class Config:
                     )
 
             logger.info(
-                f"Successfully loaded configuration with {len(self.targets.targets)} targets"
+                "Successfully loaded configuration with %d targets and %d ports",
+                len(targets),
+                sum(len(target.ports) for target in targets.values()),
             )
 
+        except FileNotFoundError as e:
+            error_msg = f"Configuration file not found: {config_file_path}"
+            logger.critical(error_msg)
+            raise FileNotFoundError(error_msg) from e
         except json.JSONDecodeError as e:
             error_msg = f"Invalid JSON in configuration file: {str(e)}"
             logger.critical(error_msg)
@@ -202,37 +216,24 @@ class Config:
         """Configure logging based on the provided settings."""
         try:
             log_level = getattr(logging, self.logging.LOG_LEVEL)
-            print(f"Setting up logging at level {self.logging.LOG_LEVEL}")
 
-            logger.info(
-                "Setting up both basic config and console handler for comprehensive logging"
-            )
-            logging.basicConfig(
-                level=log_level,
-                format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            )
-
-            logger.info("Configuring root logger")
+            logger.debug("Replacing the handler from any earlier setup_logging call")
             root_logger = logging.getLogger()
-            root_logger.setLevel(log_level)
-
-            logger.info(f"Setting module logger to level {log_level}")
-            module_logger = logging.getLogger("otg_mcp")
-            module_logger.setLevel(log_level)
+            if self._log_handler is not None:
+                root_logger.removeHandler(self._log_handler)
 
-            logger.info("Checking if root logger has handlers, adding if needed")
-            if not root_logger.handlers:
-                console_handler = logging.StreamHandler()
-                console_handler.setLevel(log_level)
-                formatter = logging.Formatter(
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(
+                logging.Formatter(
                     "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
                 )
-                console_handler.setFormatter(formatter)
-                root_logger.addHandler(console_handler)
-                print("Added console handler to root logger")
+            )
+            root_logger.addHandler(console_handler)
+            self._log_handler = console_handler
+            root_logger.setLevel(log_level)
+            logging.getLogger("otg_mcp").setLevel(log_level)
 
-            logger.info("Logging system initialized with handlers and formatters")
-            logger.info(f"Logging configured at level {self.logging.LOG_LEVEL}")
+            logger.info("Logging configured at level %s", self.logging.LOG_LEVEL)
         except Exception as e:
             print(f"CRITICAL ERROR setting up logging: {str(e)}")
             import traceback
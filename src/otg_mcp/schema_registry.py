@@ -3,14 +3,120 @@ Schema registry for the Open Traffic Generator API.
 Loads and provides access to OpenAPI schemas based on version.
 """
 
+import functools
+import hashlib
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import pickle
+import stat
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
 logger = logging.getLogger(__name__)
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+logger.debug("Parsing schemas with %s", _YamlLoader.__name__)
+
+
+def _schema_cache_dir() -> str:
+    """
+    Get the directory holding parsed schemas cached across process restarts.
+
+    Returns:
+        OTG_MCP_CACHE_DIR if set, otherwise otg-mcp/schemas under the user cache
+    """
+    override = os.environ.get("OTG_MCP_CACHE_DIR")
+    if override:
+        return override
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "otg-mcp", "schemas")
+
+
+def _normalize_version(version: str) -> str:
+    """
+    Normalize version string to directory format.
+
+    Args:
+        version: Version string (e.g. "1.30.0" or "1_30_0")
+
+    Returns:
+        Normalized version string using underscores (e.g. "1_30_0")
+    """
+    return version.replace(".", "_")
+
+
+def _is_private_cache_file(file_stat: os.stat_result) -> bool:
+    """
+    Check that a cache file can only have been written by the current user.
+
+    Cache entries are unpickled, so an entry anyone else could write must not
+    be loaded.
+
+    Args:
+        file_stat: Result of stat'ing the open cache file
+
+    Returns:
+        True if the file is owned by the current user and not group or world
+        writable
+    """
+    getuid = getattr(os, "getuid", None)
+    if getuid is not None and file_stat.st_uid != getuid():
+        return False
+    return not file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+class _SchemaCache(OrderedDict):
+    """
+    Dictionary of parsed schemas that keeps only the most recently used ones.
+
+    Reading or storing a version marks it as most recently used; storing a
+    version beyond maxsize evicts the least recently used one.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Initialize the schema cache.
+
+        Args:
+            maxsize: Maximum number of schemas held at once
+        """
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        value = super().__getitem__(key)
+        try:
+            self.move_to_end(key)
+        except KeyError:
+            logger.debug("Schema %s was evicted while being read", key)
+        return value
+
+    def get(  # type: ignore[override]
+        self, key: str, default: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: str, value: Dict[str, Any]) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            evicted, _ = self.popitem(last=False)
+            logger.info("Evicted schema %s from the schema cache", evicted)
+
+    def copy(self) -> "_SchemaCache":
+        cache = _SchemaCache(self.maxsize)
+        cache.update(self)
+        return cache
+
 
 class SchemaRegistry:
     """
@@ -20,18 +126,29 @@ class SchemaRegistry:
     for the various versions of the OTG API.
     """
 
-    def __init__(self, custom_schemas_dir: Optional[str] = None):
+    def __init__(
+        self, custom_schemas_dir: Optional[str] = None, max_cached_schemas: int = 4
+    ):
         """
         Initialize the schema registry.
 
         Args:
             custom_schemas_dir: Optional path to custom schemas directory
+            max_cached_schemas: Maximum number of parsed schemas kept in memory
         """
         logger.info("Initializing schema registry")
-        self.schemas: Dict[str, Dict[str, Any]] = {}
+        self.schemas: Dict[str, Dict[str, Any]] = _SchemaCache(max_cached_schemas)
         self._available_schemas: Optional[List[str]] = None
+        self._version_paths: Dict[str, List[Tuple[str, str]]] = {}
+        self._components_schemas: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+        self._keys_cache: Dict[
+            Tuple[str, str], Tuple[Dict[str, Any], Tuple[str, ...]]
+        ] = {}
         self._builtin_schemas_dir = os.path.join(os.path.dirname(__file__), "schemas")
         self._custom_schemas_dir = custom_schemas_dir
+        self._max_cached_schemas = max_cached_schemas
+        self._load_lock = threading.RLock()
+        self._prewarm_thread: Optional[threading.Thread] = None
 
         logger.info(
             f"Schema registry initialized with built-in schemas directory: {self._builtin_schemas_dir}"
@@ -39,18 +156,61 @@ class SchemaRegistry:
         if self._custom_schemas_dir:
             logger.info(f"Custom schemas directory: {self._custom_schemas_dir}")
 
-    def _normalize_version(self, version: str) -> str:
+        if os.environ.get("OTG_MCP_PREWARM") == "1":
+            logger.info("Prewarming schemas in the background")
+            self._prewarm_thread = threading.Thread(
+                target=self._prewarm_schemas,
+                name="otg-mcp-schema-prewarm",
+                daemon=True,
+            )
+            self._prewarm_thread.start()
+
+    def _prewarm_schemas(self) -> None:
+        """Load the newest available schema versions, up to the in-memory limit."""
+        try:
+            parsed_versions = self._get_parsed_versions(self.get_available_schemas())
+            newest = sorted(parsed_versions, key=lambda x: x[1], reverse=True)
+            newest = newest[: self._max_cached_schemas]
+            for version, _ in newest:
+                self.get_schema(version)
+            logger.info("Prewarmed %d schemas", len(newest))
+        except Exception as e:
+            logger.warning("Error prewarming schemas: %s", e)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _split_path(component: str) -> Tuple[str, ...]:
         """
-        Normalize version string to directory format.
+        Split a dotted component path into its parts.
 
         Args:
-            version: Version string (e.g. "1.30.0" or "1_30_0")
+            component: Component path (e.g. "components.schemas.Flow")
 
         Returns:
-            Normalized version string using underscores (e.g. "1_30_0")
+            Tuple of path parts (e.g. ("components", "schemas", "Flow"))
         """
-        logger.debug(f"Normalizing version string: {version}")
-        return version.replace(".", "_")
+        return tuple(component.split("."))
+
+    def _scan_schemas_dir(self, schemas_dir: str) -> List[str]:
+        """
+        List the version directories in a schemas directory.
+
+        Args:
+            schemas_dir: Directory containing one subdirectory per schema version
+
+        Returns:
+            Names of the subdirectories that contain an openapi.yaml file
+
+        Raises:
+            OSError: If the directory cannot be read
+        """
+        with os.scandir(schemas_dir) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if entry.is_dir()
+                and os.path.exists(os.path.join(entry.path, "openapi.yaml"))
+            ]
 
     def get_available_schemas(self) -> List[str]:
         """
@@ -59,60 +219,98 @@ class SchemaRegistry:
         Returns:
             List of available schema versions
         """
-        logger.info("Getting available schemas")
         if self._available_schemas is None:
-            self._available_schemas = []
+            available_schemas: List[str] = []
+            version_paths: Dict[str, List[Tuple[str, str]]] = {}
 
-            logger.debug("Checking custom schemas directory if specified")
-            if self._custom_schemas_dir and os.path.exists(self._custom_schemas_dir):
+            if self._custom_schemas_dir:
                 logger.info(
-                    f"Scanning custom schemas directory: {self._custom_schemas_dir}"
+                    "Scanning custom schemas directory: %s", self._custom_schemas_dir
                 )
                 try:
-                    custom_schemas = [
-                        d
-                        for d in os.listdir(self._custom_schemas_dir)
-                        if os.path.isdir(os.path.join(self._custom_schemas_dir, d))
-                        and os.path.exists(
-                            os.path.join(self._custom_schemas_dir, d, "openapi.yaml")
+                    custom_schemas = self._scan_schemas_dir(self._custom_schemas_dir)
+                    available_schemas.extend(custom_schemas)
+                    for schema in custom_schemas:
+                        version_paths.setdefault(schema, []).append(
+                            (
+                                os.path.join(
+                                    self._custom_schemas_dir, schema, "openapi.yaml"
+                                ),
+                                "custom",
+                            )
                         )
-                    ]
-                    self._available_schemas.extend(custom_schemas)
                     logger.info(
-                        f"Found {len(custom_schemas)} schemas in custom directory"
+                        "Found %d schemas in custom directory", len(custom_schemas)
+                    )
+                except FileNotFoundError:
+                    logger.info(
+                        "Custom schemas directory does not exist: %s",
+                        self._custom_schemas_dir,
                     )
                 except Exception as e:
-                    logger.warning(f"Error scanning custom schemas directory: {str(e)}")
+                    logger.warning("Error scanning custom schemas directory: %s", e)
 
-            logger.debug("Checking built-in schemas directory")
-            if os.path.exists(self._builtin_schemas_dir):
-                logger.info(
-                    f"Scanning built-in schemas directory: {self._builtin_schemas_dir}"
+            logger.info(
+                "Scanning built-in schemas directory: %s", self._builtin_schemas_dir
+            )
+            try:
+                built_in_schemas = self._scan_schemas_dir(self._builtin_schemas_dir)
+            except FileNotFoundError:
+                logger.warning(
+                    "Built-in schemas directory does not exist: %s",
+                    self._builtin_schemas_dir,
                 )
-                built_in_schemas = [
-                    d
-                    for d in os.listdir(self._builtin_schemas_dir)
-                    if os.path.isdir(os.path.join(self._builtin_schemas_dir, d))
-                    and os.path.exists(
-                        os.path.join(self._builtin_schemas_dir, d, "openapi.yaml")
+                built_in_schemas = []
+
+            for schema in built_in_schemas:
+                if schema not in available_schemas:
+                    available_schemas.append(schema)
+                version_paths.setdefault(schema, []).append(
+                    (
+                        os.path.join(self._builtin_schemas_dir, schema, "openapi.yaml"),
+                        "built-in",
                     )
-                ]
-
-                logger.debug(
-                    "Adding built-in schemas that don't conflict with custom schemas"
-                )
-                for schema in built_in_schemas:
-                    if schema not in self._available_schemas:
-                        self._available_schemas.append(schema)
-
-                logger.info(
-                    f"Found {len(built_in_schemas)} schemas in built-in directory"
                 )
 
-            logger.info(f"Total available schemas: {len(self._available_schemas)}")
+            logger.info(
+                "Found %d schemas in built-in directory, %d available in total",
+                len(built_in_schemas),
+                len(available_schemas),
+            )
+            self._version_paths = version_paths
+            self._available_schemas = available_schemas
 
         return self._available_schemas
 
+    def _schema_paths(self, version: str) -> List[Tuple[str, str]]:
+        """
+        Get the schema files to try for a version, custom before built-in.
+
+        Uses the paths found by the last directory scan, and otherwise builds
+        them from the schema directories so loading doesn't depend on how
+        get_available_schemas was resolved.
+
+        Args:
+            version: Normalized schema version
+
+        Returns:
+            List of (path, source type) pairs to load the schema from
+        """
+        paths = self._version_paths.get(version)
+        if paths:
+            return paths
+
+        candidates: List[Tuple[str, str]] = []
+        if self._custom_schemas_dir:
+            custom_path = os.path.join(
+                self._custom_schemas_dir, version, "openapi.yaml"
+            )
+            if os.path.exists(custom_path):
+                candidates.append((custom_path, "custom"))
+        builtin_path = os.path.join(self._builtin_schemas_dir, version, "openapi.yaml")
+        candidates.append((builtin_path, "built-in"))
+        return candidates
+
     def schema_exists(self, version: str) -> bool:
         """
         Check if a schema version exists.
@@ -123,11 +321,9 @@ class SchemaRegistry:
         Returns:
             True if the schema exists, False otherwise
         """
-        normalized = self._normalize_version(version)
-        logger.debug(f"Checking if schema exists: {version} (normalized: {normalized})")
-        return normalized in self.get_available_schemas()
+        return _normalize_version(version) in self.get_available_schemas()
 
-    def list_schemas(self, version: str) -> List[str]:
+    def list_schemas(self, version: str) -> Tuple[str, ...]:
         """
         List all schema keys for a specific version.
 
@@ -135,56 +331,61 @@ class SchemaRegistry:
             version: Schema version (e.g. "1.30.0" or "1_30_0")
 
         Returns:
-            List of top-level schema keys
+            Tuple of top-level schema keys
 
         Raises:
             ValueError: If the schema version does not exist
         """
-        logger.info(f"Listing schemas for version: {version}")
-        normalized = self._normalize_version(version)
-
-        logger.info(f"Getting schema for version {normalized}")
+        normalized = _normalize_version(version)
         schema = self.get_schema(normalized)
+        return self._get_keys(normalized, "", schema)
 
-        logger.debug("Returning top-level schema keys")
-        keys = list(schema.keys())
-        logger.info(f"Found {len(keys)} top-level keys in schema {version}")
+    def _get_keys(
+        self, version: str, path: str, mapping: Dict[str, Any]
+    ) -> Tuple[str, ...]:
+        """
+        Get the keys of a mapping inside a loaded schema, computing them once.
+
+        Args:
+            version: Normalized version of the schema holding the mapping
+            path: Component path of the mapping ("" for the schema root)
+            mapping: The mapping found at that path
+
+        Returns:
+            Tuple of the mapping's keys
+        """
+        cached = self._keys_cache.get((version, path))
+        if cached is not None and cached[0] is mapping:
+            return cached[1]
+        keys = tuple(mapping)
+        self._keys_cache[(version, path)] = (mapping, keys)
         return keys
 
     def get_schema_components(
         self, version: str, path_prefix: str = "components.schemas"
-    ) -> List[str]:
+    ) -> Tuple[str, ...]:
         """
-        Get a list of component names in a schema.
+        Get the component names in a schema.
 
         Args:
             version: Schema version (e.g. "1.30.0" or "1_30_0")
             path_prefix: The path prefix to look in (default: "components.schemas")
 
         Returns:
-            List of component names
+            Tuple of component names
 
         Raises:
             ValueError: If the schema version or path does not exist
         """
-        logger.info(
-            f"Getting schema components for {version} with prefix {path_prefix}"
-        )
-        normalized = self._normalize_version(version)
-
-        logger.info(f"Getting component at path {path_prefix}")
-        component = self.get_schema(normalized, path_prefix)
-
-        logger.debug("Returning component keys")
+        component = self.get_schema(version, path_prefix)
         if isinstance(component, dict):
-            keys = list(component.keys())
-            logger.info(f"Found {len(keys)} components at path {path_prefix}")
-            return keys
-        else:
-            logger.warning(f"Component at {path_prefix} is not a dictionary")
-            return []
+            return self._get_keys(_normalize_version(version), path_prefix, component)
+        logger.warning("Component at %s is not a dictionary", path_prefix)
+        return ()
 
-    def _load_schema_from_path(self, path: str, version: str, source_type: str) -> bool:
+    def _load_schema_from_path(
+        self, path: str, version: str, source_type: str
+    ) -> Optional[Dict[str, Any]]:
         """
         Load schema from a specified path into the cache.
 
@@ -194,17 +395,182 @@ class SchemaRegistry:
             source_type: Source type for logging ('custom' or 'built-in')
 
         Returns:
-            True if schema was loaded successfully, False otherwise
+            The loaded schema, or None if it could not be loaded
         """
-        logger.info(f"Loading schema from {source_type} path: {path}")
+        logger.info("Loading schema from %s path: %s", source_type, path)
         try:
-            with open(path, "r") as f:
-                self.schemas[version] = yaml.safe_load(f)
-            logger.info(f"Successfully loaded schema from {source_type} path")
-            return True
+            cache_key = self._cache_key(path)
+            entry = self._read_cache_entry(path)
+            if entry is not None and cache_key is not None and entry[0] == cache_key:
+                logger.debug("Loaded parsed schema for %s from cache", path)
+                schema = entry[2]
+            else:
+                with open(path, "rb") as f:
+                    raw_schema = f.read()
+                content_digest = hashlib.sha256(raw_schema).hexdigest()
+                if entry is not None and entry[1] == content_digest:
+                    logger.debug("Schema %s has new metadata but same contents", path)
+                    schema = entry[2]
+                else:
+                    schema = yaml.load(raw_schema, Loader=_YamlLoader)
+                self._write_cached_schema(path, cache_key, content_digest, schema)
+            self.schemas[version] = schema
+            for stale_version in list(self._components_schemas):
+                if stale_version not in self.schemas:
+                    self._components_schemas.pop(stale_version, None)
+            for stale_key in list(self._keys_cache):
+                if stale_key[0] not in self.schemas:
+                    self._keys_cache.pop(stale_key, None)
+            logger.info("Successfully loaded schema from %s path", source_type)
+            return schema
         except Exception as e:
-            logger.error(f"Error loading schema from {source_type} path: {str(e)}")
-            return False
+            logger.error("Error loading schema from %s path: %s", source_type, e)
+            return None
+
+    def _index_components_schemas(
+        self, version: str, schema: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Remember the components.schemas dictionary of a loaded schema.
+
+        Args:
+            version: Normalized version the schema is stored under
+            schema: The schema stored in self.schemas for that version
+
+        Returns:
+            The components.schemas dictionary, or None if the schema has none
+        """
+        try:
+            components_schemas = schema["components"]["schemas"]
+        except KeyError:
+            self._components_schemas.pop(version, None)
+            return None
+        self._components_schemas[version] = (schema, components_schemas)
+        return components_schemas
+
+    def _get_components_schemas(
+        self, version: str, schema: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Get the components.schemas dictionary of a loaded schema.
+
+        The dictionary is indexed on first use and re-indexed only if the
+        schema stored for the version has been replaced since.
+
+        Args:
+            version: Normalized version the schema was loaded under
+            schema: The loaded schema for that version
+
+        Returns:
+            The components.schemas dictionary
+
+        Raises:
+            KeyError: If the schema has no components.schemas section
+        """
+        indexed = self._components_schemas.get(version)
+        if indexed is not None and indexed[0] is schema:
+            return indexed[1]
+        components_schemas = self._index_components_schemas(version, schema)
+        if components_schemas is None:
+            raise KeyError("schemas")
+        return components_schemas
+
+    def _cache_file_for(self, path: str) -> str:
+        """
+        Get the parsed-schema cache file for a schema file.
+
+        Args:
+            path: Path to the schema file
+
+        Returns:
+            Path of the pickle file caching the parsed schema
+        """
+        digest = hashlib.sha256(os.path.abspath(path).encode("utf-8")).hexdigest()
+        return os.path.join(_schema_cache_dir(), f"{digest}.pickle")
+
+    def _cache_key(self, path: str) -> Optional[Tuple[int, int]]:
+        """
+        Get the key identifying the current contents of a schema file.
+
+        Args:
+            path: Path to the schema file
+
+        Returns:
+            Tuple of (mtime in nanoseconds, size), or None if the file can't be stat'ed
+        """
+        try:
+            file_stat = os.stat(path)
+        except OSError as e:
+            logger.debug("Cannot stat %s for schema caching: %s", path, e)
+            return None
+        return (file_stat.st_mtime_ns, file_stat.st_size)
+
+    def _read_cache_entry(
+        self, path: str
+    ) -> Optional[Tuple[Tuple[int, int], str, Dict[str, Any]]]:
+        """
+        Read the on-disk cache entry of a schema file.
+
+        Args:
+            path: Path to the schema file
+
+        Returns:
+            Tuple of (stat key, content digest, parsed schema) stored when the
+            schema was cached, or None if there is no readable, private entry
+        """
+        cache_file = self._cache_file_for(path)
+        try:
+            with open(cache_file, "rb") as f:
+                if not _is_private_cache_file(os.fstat(f.fileno())):
+                    logger.warning(
+                        "Ignoring schema cache entry %s: it is writable by "
+                        "other users",
+                        cache_file,
+                    )
+                    return None
+                stored_key, stored_digest, schema = pickle.load(f)
+        except Exception as e:
+            logger.debug("No usable schema cache entry for %s: %s", path, e)
+            return None
+        return stored_key, stored_digest, schema
+
+    def _write_cached_schema(
+        self,
+        path: str,
+        cache_key: Optional[Tuple[int, int]],
+        content_digest: str,
+        schema: Dict[str, Any],
+    ) -> None:
+        """
+        Store a parsed schema in the on-disk cache, ignoring any failure.
+
+        Args:
+            path: Path to the schema file the schema was parsed from
+            cache_key: Key of the schema file's contents taken before parsing
+            content_digest: SHA-256 hex digest of the schema file's bytes
+            schema: The parsed schema
+        """
+        if cache_key is None:
+            return
+        temp_file = None
+        try:
+            cache_file = self._cache_file_for(path)
+            cache_dir = os.path.dirname(cache_file)
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+            fd, temp_file = tempfile.mkstemp(
+                dir=cache_dir, prefix=f"{os.path.basename(cache_file)}.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((cache_key, content_digest, schema), f, protocol=5)
+            os.replace(temp_file, cache_file)
+            logger.debug("Cached parsed schema for %s in %s", path, cache_file)
+        except Exception as e:
+            logger.debug("Could not cache parsed schema for %s: %s", path, e)
+            if temp_file is not None:
+                try:
+                    os.unlink(temp_file)
+                except OSError:
+                    logger.debug("Could not remove temporary cache file %s", temp_file)
 
     def _parse_version(self, version: str) -> tuple:
         """
@@ -216,7 +582,7 @@ class SchemaRegistry:
         Returns:
             Tuple of integers representing the version
         """
-        parts = version.replace(".", "_").split("_")
+        parts = _normalize_version(version).split("_")
         try:
             return tuple(int(part) for part in parts if part.isdigit())
         except ValueError:
@@ -240,89 +606,60 @@ class SchemaRegistry:
         Raises:
             ValueError: If the schema version or component does not exist
         """
-        logger.info(
-            f"Getting schema for version: {version}, component: {component or 'all'}"
-        )
-        normalized = self._normalize_version(version)
-
-        logger.info(f"Validating schema version exists: {version}")
-        if not self.schema_exists(normalized):
-            logger.error(f"Schema version not found: {version}")
-            raise ValueError(f"Schema version {version} not found")
-
-        logger.info(f"Loading schema if not already cached: {normalized}")
-        if normalized not in self.schemas:
-            logger.debug("Checking custom schemas directory first if specified")
-            success = False
-            if self._custom_schemas_dir:
-                custom_schema_path = os.path.join(
-                    self._custom_schemas_dir, normalized, "openapi.yaml"
-                )
-                if os.path.exists(custom_schema_path):
-                    success = self._load_schema_from_path(
-                        custom_schema_path, normalized, "custom"
-                    )
-
-            logger.debug("Trying built-in path if not loaded from custom path")
-            if not success:
-                builtin_schema_path = os.path.join(
-                    self._builtin_schemas_dir, normalized, "openapi.yaml"
-                )
-                if not self._load_schema_from_path(
-                    builtin_schema_path, normalized, "built-in"
-                ):
-                    raise ValueError(f"Error loading schema {normalized}")
+        normalized = _normalize_version(version)
+
+        schema = self.schemas.get(normalized)
+        if schema is None:
+            if not self.schema_exists(normalized):
+                logger.error("Schema version not found: %s", version)
+                raise ValueError(f"Schema version {version} not found")
+
+            with self._load_lock:
+                schema = self.schemas.get(normalized)
+                if schema is None:
+                    for path, source_type in self._schema_paths(normalized):
+                        schema = self._load_schema_from_path(
+                            path, normalized, source_type
+                        )
+                        if schema is not None:
+                            break
+                    else:
+                        raise ValueError(f"Error loading schema {normalized}")
 
         if not component:
-            logger.debug("Returning full schema")
-            return self.schemas[normalized]
+            return schema
 
-        logger.info(
-            f"Checking if component path requires special handling: {component}"
-        )
         if component.startswith("components.schemas."):
-            logger.debug("Using special handling for components.schemas.X path")
             schema_name = component[len("components.schemas.") :]
-            logger.debug(f"Extracted schema name: {schema_name}")
-
-            logger.debug(f"Getting schemas dictionary for {normalized}")
             try:
-                schemas = self.schemas[normalized]["components"]["schemas"]
-
-                logger.debug(f"Checking if schema {schema_name} exists directly")
-                if schema_name in schemas:
-                    logger.info(f"Found schema {schema_name}")
-                    return schemas[schema_name]
+                schemas = self._get_components_schemas(normalized, schema)
+            except KeyError as e:
+                error_msg = f"Error accessing components.schemas: {str(e)}"
+                logger.error(error_msg)
+                raise ValueError(error_msg)
 
-                logger.error(f"Schema {schema_name} not found in components.schemas")
+            try:
+                return schemas[schema_name]
+            except (KeyError, TypeError):
                 error_msg = f"Schema {schema_name} not found in components.schemas"
                 logger.error(error_msg)
                 raise ValueError(error_msg)
 
-            except KeyError as e:
-                error_msg = f"Error accessing components.schemas: {str(e)}"
+        result = schema
+        for comp in self._split_path(component):
+            try:
+                result = result[comp]
+            except KeyError:
+                error_msg = f"Component {comp} not found in path {component}"
+                logger.error(error_msg)
+                raise ValueError(error_msg)
+            except TypeError as e:
+                error_msg = f"Invalid component path {component}: {str(e)}"
                 logger.error(error_msg)
                 raise ValueError(error_msg)
 
-        logger.info("Using standard navigation through component path")
-        logger.info(f"Navigating to component: {component}")
-        components = component.split(".")
-        result = self.schemas[normalized]
-
-        try:
-            for comp in components:
-                if comp in result:
-                    result = result[comp]
-                else:
-                    error_msg = f"Component {comp} not found in path {component}"
-                    logger.error(error_msg)
-                    raise ValueError(error_msg)
-        except (TypeError, KeyError) as e:
-            error_msg = f"Invalid component path {component}: {str(e)}"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
-
-        logger.info(f"Successfully retrieved component {component}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Retrieved component %s of schema %s", component, normalized)
         return result
 
     def _get_parsed_versions(self, available_versions: List[str]) -> List[tuple]:
@@ -371,7 +708,7 @@ class SchemaRegistry:
             raise ValueError(error_msg)
 
         logger.debug("Checking for exact schema version match first")
-        normalized = self._normalize_version(requested_version)
+        normalized = _normalize_version(requested_version)
         if normalized in available_versions:
             logger.info(
                 f"Found exact schema match for {requested_version}: {normalized}"
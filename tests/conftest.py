@@ -17,10 +17,18 @@ from otg_mcp.client import OtgClient
 from otg_mcp.config import Config, PortConfig, TargetConfig
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def schema_cache_dir(tmp_path_factory):
+    """Keep the parsed-schema cache out of the user's cache directory."""
+    cache_dir = tmp_path_factory.mktemp("schema-cache")
+    with mock.patch.dict(os.environ, {"OTG_MCP_CACHE_DIR": str(cache_dir)}):
+        yield cache_dir
+
+
+@pytest.fixture(scope="session")
 def api_schema():
     """
-    Load the test API schema from fixtures directory.
+    Load the test API schema from fixtures directory once per session.
 
     Returns:
         dict: The parsed OpenAPI schema
@@ -30,19 +38,20 @@ def api_schema():
         return yaml.safe_load(f)
 
 
-@pytest.fixture
-def mock_schema_registry(api_schema, monkeypatch):
+@pytest.fixture(scope="session")
+def mock_schema_registry(api_schema):
     """
-    Create a mock schema registry that uses the test apiSchema.yml.
+    Create a schema registry that serves the test apiSchema.yml.
+
+    The registry is shared by the whole session, so tests must not modify it.
 
     Args:
         api_schema: The API schema fixture
-        monkeypatch: PyTest monkeypatch fixture
 
     Returns:
-        Mock schema registry that returns the test schema
+        Schema registry that returns the test schema
     """
-    from otg_mcp.schema_registry import SchemaRegistry
+    from otg_mcp.schema_registry import SchemaRegistry, _normalize_version
 
     # Create a class that inherits from the original but overrides key methods
     class TestSchemaRegistry(SchemaRegistry):
@@ -54,16 +63,9 @@ def mock_schema_registry(api_schema, monkeypatch):
             return ["1_30_0"]
 
         def schema_exists(self, version):
-            return self._normalize_version(version) == "1_30_0"
-
-    # Create an instance of our test registry
-    test_registry = TestSchemaRegistry()
-
-    # Patch the get_schema_registry function to return our test registry
-    from otg_mcp import schema_registry
-    monkeypatch.setattr(schema_registry, "get_schema_registry", lambda: test_registry)
+            return _normalize_version(version) == "1_30_0"
 
-    return test_registry
+    return TestSchemaRegistry()
 
 
 @pytest.fixture
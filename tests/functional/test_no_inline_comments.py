@@ -4,6 +4,7 @@ All comments should be converted to logging statements.
 """
 
 import os
+import re
 import sys
 
 import pytest
@@ -17,6 +18,9 @@ logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
                    stream=sys.stdout)
 
+# Matches every line that contains a # character
+COMMENT_LINE_PATTERN = re.compile(r"^[^\n]*#[^\n]*$", re.MULTILINE)
+
 
 def test_no_inline_comments():
     """Test that there are no inline comments in Python files."""
@@ -44,19 +48,10 @@ def test_no_inline_comments():
         print(f"Searching base path: {base_path}")
         print(f"Does path exist? {os.path.exists(base_path)}")
 
-        # Print directory structure first
-        for root, dirs, files in os.walk(base_path):
-            print(f"Directory: {root}")
-            print(f"Files: {files}")
-
-        print("Now searching for Python files...")
         for root, _, files in os.walk(base_path):
-            print(f"Checking dir: {root}, Files: {files}")
             for file in files:
-                print(f"Found file: {file} in {root}")
                 # Process all Python files
                 if file.endswith(target_extension):
-                    print(f"PROCESSING TARGET FILE: {file}")
                     filepath = os.path.join(root, file)
                     logger.info("Examining file: %s", filepath)
 
@@ -72,37 +67,25 @@ def test_no_inline_comments():
                     module_path = rel_path.replace("/", ".").replace(".py", "")
                     logger.info("Module path: %s", module_path)
                     comment_lines = []
-                    for i, line in enumerate(content.splitlines()):
-                        stripped_line = line.strip()
-
-                        # Skip empty lines
-                        if not stripped_line:
-                            continue
-
-                        # Skip lines in allowlist
-                        if any(
-                            pattern in stripped_line for pattern in allowlist_patterns
-                        ):
+                    line_num = 1
+                    line_start = 0
+                    # Only lines containing a # character can be comments
+                    for match in COMMENT_LINE_PATTERN.finditer(content):
+                        line_num += content.count("\n", line_start, match.start())
+                        line_start = match.start()
+                        stripped_line = match.group(0).strip()
+
+                        # Skip allowlisted patterns
+                        if any(pattern in stripped_line for pattern in allowlist_patterns):
                             continue
 
                         # Skip comments at file beginning (first 5 lines)
-                        if i < 5 and stripped_line.startswith("#"):
+                        if line_num <= 5 and stripped_line.startswith("#"):
                             continue
 
-                        # Print every line with a # character
-                        if "#" in stripped_line:
-                            print(f"Line {i+1}: {stripped_line}")
-                            # Skip allowlisted patterns
-                            if any(pattern in stripped_line for pattern in allowlist_patterns):
-                                continue
-
-                            # Skip comments at file beginning (first 5 lines)
-                            if i < 5 and stripped_line.startswith("#"):
-                                continue
-
-                            # Add to problematic lines
-                            logger.info("Found comment at line %d: %s", i + 1, stripped_line)
-                            comment_lines.append((i + 1, stripped_line))
+                        # Add to problematic lines
+                        logger.info("Found comment at line %d: %s", line_num, stripped_line)
+                        comment_lines.append((line_num, stripped_line))
 
                     if comment_lines:
                         # Group by module name for better organization
@@ -0,0 +1,129 @@
+"""
+Tests for the on-disk cache of parsed schemas.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from otg_mcp.schema_registry import SchemaRegistry
+
+
+@pytest.fixture
+def custom_schema_dir(tmp_path):
+    """Create a custom schemas directory with a single version."""
+    version_dir = tmp_path / "9_9_9"
+    version_dir.mkdir()
+    schema = {"openapi": "3.0.0", "components": {"schemas": {"Flow": {}}}}
+    (version_dir / "openapi.yaml").write_text(yaml.dump(schema))
+    return tmp_path
+
+
+def test_parsed_schema_written_to_cache(custom_schema_dir, schema_cache_dir):
+    """Test that parsing a schema stores it in the cache directory."""
+    registry = SchemaRegistry(str(custom_schema_dir))
+    schema_path = os.path.join(custom_schema_dir, "9_9_9", "openapi.yaml")
+
+    registry.get_schema("9_9_9")
+
+    assert os.path.exists(registry._cache_file_for(schema_path))
+    assert registry._cache_file_for(schema_path).startswith(str(schema_cache_dir))
+
+
+def test_cached_schema_skips_yaml_parsing(custom_schema_dir):
+    """Test that a fresh registry loads a cached schema without parsing YAML."""
+    SchemaRegistry(str(custom_schema_dir)).get_schema("9_9_9")
+
+    registry = SchemaRegistry(str(custom_schema_dir))
+    with patch("yaml.load", side_effect=AssertionError("YAML parsed")):
+        schema = registry.get_schema("9_9_9")
+
+    assert "Flow" in schema["components"]["schemas"]
+
+
+def test_modified_schema_invalidates_cache(custom_schema_dir):
+    """Test that changing the schema file causes it to be parsed again."""
+    SchemaRegistry(str(custom_schema_dir)).get_schema("9_9_9")
+
+    schema_path = custom_schema_dir / "9_9_9" / "openapi.yaml"
+    updated = {"openapi": "3.0.0", "components": {"schemas": {"Port": {}}}}
+    schema_path.write_text(yaml.dump(updated) + "\n")
+
+    schema = SchemaRegistry(str(custom_schema_dir)).get_schema("9_9_9")
+
+    assert "Port" in schema["components"]["schemas"]
+    assert "Flow" not in schema["components"]["schemas"]
+
+
+def test_corrupt_cache_entry_falls_back_to_yaml(custom_schema_dir):
+    """Test that an unreadable cache entry is ignored."""
+    registry = SchemaRegistry(str(custom_schema_dir))
+    schema_path = os.path.join(custom_schema_dir, "9_9_9", "openapi.yaml")
+    cache_file = registry._cache_file_for(schema_path)
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    with open(cache_file, "wb") as f:
+        f.write(b"not a pickle")
+
+    schema = registry.get_schema("9_9_9")
+
+    assert "Flow" in schema["components"]["schemas"]
+
+
+def test_touched_schema_reuses_cache_by_content(custom_schema_dir):
+    """Test that a schema file with a new mtime but the same bytes isn't re-parsed."""
+    SchemaRegistry(str(custom_schema_dir)).get_schema("9_9_9")
+
+    schema_path = custom_schema_dir / "9_9_9" / "openapi.yaml"
+    stat = os.stat(schema_path)
+    os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    registry = SchemaRegistry(str(custom_schema_dir))
+    with patch("yaml.load", side_effect=AssertionError("YAML parsed")):
+        schema = registry.get_schema("9_9_9")
+
+    assert "Flow" in schema["components"]["schemas"]
+    entry = registry._read_cache_entry(str(schema_path))
+    assert entry[0] == registry._cache_key(str(schema_path))
+
+
+def test_cache_entries_are_private(custom_schema_dir, tmp_path, monkeypatch):
+    """Test that the cache directory and entries are only accessible to the owner."""
+    cache_dir = tmp_path / "private-cache"
+    monkeypatch.setenv("OTG_MCP_CACHE_DIR", str(cache_dir))
+    registry = SchemaRegistry(str(custom_schema_dir))
+    schema_path = os.path.join(custom_schema_dir, "9_9_9", "openapi.yaml")
+
+    registry.get_schema("9_9_9")
+
+    assert os.stat(cache_dir).st_mode & 0o777 == 0o700
+    assert os.stat(registry._cache_file_for(schema_path)).st_mode & 0o777 == 0o600
+
+
+def test_writable_cache_entry_is_not_unpickled(custom_schema_dir):
+    """Test that a cache entry writable by other users is ignored."""
+    SchemaRegistry(str(custom_schema_dir)).get_schema("9_9_9")
+    registry = SchemaRegistry(str(custom_schema_dir))
+    schema_path = os.path.join(custom_schema_dir, "9_9_9", "openapi.yaml")
+    os.chmod(registry._cache_file_for(schema_path), 0o666)
+
+    with patch("pickle.load", side_effect=AssertionError("unpickled")):
+        schema = registry.get_schema("9_9_9")
+
+    assert "Flow" in schema["components"]["schemas"]
+
+
+def test_failed_cache_write_leaves_no_temp_file(
+    custom_schema_dir, tmp_path, monkeypatch
+):
+    """Test that a cache write that fails part way removes its temporary file."""
+    cache_dir = tmp_path / "failing-cache"
+    monkeypatch.setenv("OTG_MCP_CACHE_DIR", str(cache_dir))
+    registry = SchemaRegistry(str(custom_schema_dir))
+
+    with patch("pickle.dump", side_effect=OSError("disk full")):
+        schema = registry.get_schema("9_9_9")
+
+    assert "Flow" in schema["components"]["schemas"]
+    assert os.listdir(cache_dir) == []
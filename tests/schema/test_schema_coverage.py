@@ -2,6 +2,7 @@
 Tests for achieving full coverage of the schema registry.
 """
 
+import os
 from unittest.mock import patch, mock_open
 
 import pytest
@@ -16,23 +17,21 @@ def test_get_available_schemas_exception_handling():
     registry = SchemaRegistry(custom_dir)
     
     # Create a selective mock that only raises an exception for the custom directory
-    def selective_listdir(path):
+    original_scandir = os.scandir
+
+    def selective_scandir(path):
         if path == custom_dir:
             raise PermissionError("Permission denied")
-        # Return some schema directories for the built-in path
-        return ["1_30_0", "1_28_0"]
-
-    # Mock os.path.exists to return True for all paths
-    with patch('os.path.exists', return_value=True):
-        # Use the selective mock for listdir
-        with patch('os.listdir', side_effect=selective_listdir):
-            with patch('os.path.isdir', return_value=True):
-                # This should not raise an exception but handle it gracefully
-                available_schemas = registry.get_available_schemas()
-                assert isinstance(available_schemas, list)
-                # Should still have the built-in schemas
-                assert "1_30_0" in available_schemas
-                assert "1_28_0" in available_schemas
+        # Scan the real built-in schemas directory
+        return original_scandir(path)
+
+    with patch('os.scandir', side_effect=selective_scandir):
+        # This should not raise an exception but handle it gracefully
+        available_schemas = registry.get_available_schemas()
+        assert isinstance(available_schemas, list)
+        # Should still have the built-in schemas
+        assert "1_30_0" in available_schemas
+        assert "1_28_0" in available_schemas
 
 
 def test_load_schema_from_path_error():
@@ -46,8 +45,8 @@ def test_load_schema_from_path_error():
     with patch("builtins.open", mock_file):
         # Try to load from a schema path
         result = registry._load_schema_from_path("/fake/path/schema.yaml", "1_30_0", "test")
-        # Should return False indicating failure
-        assert result is False
+        # Should return None indicating failure
+        assert result is None
 
 def test_load_schema_yaml_error():
     """Test handling of YAML parsing errors."""
@@ -57,12 +56,12 @@ def test_load_schema_yaml_error():
     mock_file = mock_open(read_data="invalid: yaml: content: - [")
 
     with patch("builtins.open", mock_file):
-        # Mock yaml.safe_load to raise a YAML parsing error
-        with patch("yaml.safe_load", side_effect=yaml.YAMLError("YAML parsing error")):
+        # Mock yaml.load to raise a YAML parsing error
+        with patch("yaml.load", side_effect=yaml.YAMLError("YAML parsing error")):
             # Try to load from a schema path with invalid YAML
             result = registry._load_schema_from_path("/fake/path/schema.yaml", "1_30_0", "test")
-            # Should return False indicating failure
-            assert result is False
+            # Should return None indicating failure
+            assert result is None
 
 
 def test_parse_version_malformed():
@@ -134,6 +133,6 @@ def test_get_schema_components_non_dict():
     # Mock the registry to return our test schema
     with patch.object(registry, "schema_exists", return_value=True):
         with patch.dict(registry.schemas, {"1_30_0": mock_schema}):
-            # Should return an empty list for non-dictionary components
+            # Should return an empty tuple for non-dictionary components
             result = registry.get_schema_components("1_30_0")
-            assert result == []
+            assert result == ()
@@ -2,6 +2,8 @@
 Edge case tests to achieve 100% coverage of the schema registry.
 """
 
+import os
+import threading
 from unittest.mock import patch
 
 import pytest
@@ -61,12 +63,11 @@ def test_loading_schema_from_builtin_path_after_custom_fails():
     
     # Create a side effect function for _load_schema_from_path
     def load_schema_side_effect(path, version, source_type):
-        # Return False for custom path, True for built-in path
-        result = source_type == "built-in"
-        if result:
-            # Need to actually populate the schema when returning True
-            registry.schemas[version] = {"test": "schema"}
-        return result
+        # Fail for custom path, return the schema for built-in path
+        if source_type != "built-in":
+            return None
+        registry.schemas[version] = {"test": "schema"}
+        return registry.schemas[version]
     
     # Mock methods
     with patch.object(registry, "schema_exists", return_value=True):
@@ -75,3 +76,143 @@ def test_loading_schema_from_builtin_path_after_custom_fails():
             result = registry.get_schema("1_30_0")
             # Verify we got the schema we set in the mock
             assert result == {"test": "schema"}
+
+
+def test_cached_schema_skips_version_lookup():
+    """Test that an already loaded schema is returned without rescanning versions."""
+    registry = SchemaRegistry()
+    registry.schemas["1_30_0"] = {"test": "schema"}
+
+    with patch.object(registry, "schema_exists", side_effect=AssertionError("scanned")):
+        assert registry.get_schema("1.30.0") == {"test": "schema"}
+
+
+def test_components_schemas_index_follows_replaced_schema():
+    """Test that components.schemas lookups see a schema replaced after indexing."""
+    registry = SchemaRegistry()
+    registry.schemas["1_30_0"] = {"components": {"schemas": {"Flow": {"v": 1}}}}
+    assert registry.get_schema("1_30_0", "components.schemas.Flow") == {"v": 1}
+
+    registry.schemas["1_30_0"] = {"components": {"schemas": {"Flow": {"v": 2}}}}
+    assert registry.get_schema("1_30_0", "components.schemas.Flow") == {"v": 2}
+
+
+def test_schema_cache_evicts_least_recently_used():
+    """Test that the registry keeps at most max_cached_schemas parsed schemas."""
+    registry = SchemaRegistry(max_cached_schemas=2)
+
+    registry.get_schema("1.28.0")
+    registry.get_schema("1.29.0")
+    registry.get_schema("1.28.0")
+    registry.get_schema("1.30.0")
+
+    assert list(registry.schemas) == ["1_28_0", "1_30_0"]
+    assert "paths" in registry.get_schema("1.29.0")
+    assert list(registry.schemas) == ["1_30_0", "1_29_0"]
+
+
+def _write_small_schemas(tmp_path, versions):
+    """Write a minimal schema with a Flow component for each version."""
+    for version in versions:
+        version_dir = tmp_path / version
+        version_dir.mkdir()
+        (version_dir / "openapi.yaml").write_text(
+            "openapi: 3.0.0\ncomponents:\n  schemas:\n    Flow:\n      type: object\n"
+        )
+
+
+def test_get_schema_returns_schema_evicted_by_its_own_load(tmp_path):
+    """Test that get_schema serves a schema even if it is evicted straight away."""
+    _write_small_schemas(tmp_path, ["1_1_0"])
+    registry = SchemaRegistry(str(tmp_path), max_cached_schemas=0)
+
+    assert registry.get_schema("1.1.0")["openapi"] == "3.0.0"
+    flow = registry.get_schema("1.1.0", "components.schemas.Flow")
+    assert flow == {"type": "object"}
+    assert "1_1_0" not in registry.schemas
+
+
+def test_get_schema_under_concurrent_eviction(tmp_path):
+    """Test that threads evicting each other's schemas never see a KeyError."""
+    versions = ["1_1_0", "1_2_0", "1_3_0", "1_4_0"]
+    _write_small_schemas(tmp_path, versions)
+    registry = SchemaRegistry(str(tmp_path), max_cached_schemas=1)
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(50):
+                version = versions[(i + offset) % len(versions)]
+                registry.get_schema(version)
+                registry.get_schema(version, "components.schemas.Flow")
+                registry.get_schema(version, "components.schemas")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+def test_get_schema_loads_when_available_schemas_is_overridden():
+    """Test that loading doesn't rely on get_available_schemas scanning paths."""
+
+    class ListedRegistry(SchemaRegistry):
+        def get_available_schemas(self):
+            return ["1_30_0"]
+
+    registry = ListedRegistry()
+
+    assert "paths" in registry.get_schema("1.30.0")
+
+
+def test_list_schemas_reuses_loaded_schema():
+    """Test that repeated list_schemas calls load the schema once."""
+    registry = SchemaRegistry()
+
+    keys = registry.list_schemas("1.30.0")
+
+    assert "1_30_0" in registry.schemas
+    assert keys == tuple(registry.get_schema("1.30.0").keys())
+    with patch.object(
+        registry, "_load_schema_from_path", side_effect=AssertionError("reloaded")
+    ):
+        assert registry.list_schemas("1.30.0") is keys
+
+
+def test_prewarm_loads_newest_schemas_in_background():
+    """Test that OTG_MCP_PREWARM=1 loads the newest schemas on a background thread."""
+    with patch.dict(os.environ, {"OTG_MCP_PREWARM": "1"}):
+        registry = SchemaRegistry(max_cached_schemas=2)
+
+    registry._prewarm_thread.join(timeout=30)
+
+    assert not registry._prewarm_thread.is_alive()
+    assert sorted(registry.schemas) == ["1_29_0", "1_30_0"]
+
+
+def test_prewarm_is_off_by_default():
+    """Test that no prewarm thread is started unless requested."""
+    with patch.dict(os.environ):
+        os.environ.pop("OTG_MCP_PREWARM", None)
+        registry = SchemaRegistry()
+
+    assert registry._prewarm_thread is None
+    assert len(registry.schemas) == 0
+
+
+def test_component_keys_are_computed_once_per_schema():
+    """Test that component names are cached until the schema is replaced."""
+    registry = SchemaRegistry()
+    registry.schemas["1_30_0"] = {"components": {"schemas": {"Flow": {}}}}
+
+    first = registry.get_schema_components("1.30.0")
+    assert first == ("Flow",)
+    assert registry.get_schema_components("1_30_0") is first
+
+    registry.schemas["1_30_0"] = {"components": {"schemas": {"Port": {}}}}
+    assert registry.get_schema_components("1_30_0") == ("Port",)
@@ -16,7 +16,7 @@ def test_get_schema_error_loading():
     # Mock schema_exists to return True but load_schema to fail
     with patch.object(registry, "schema_exists", return_value=True):
         # Force _load_schema_from_path to always fail for both custom and built-in
-        with patch.object(registry, "_load_schema_from_path", return_value=False):
+        with patch.object(registry, "_load_schema_from_path", return_value=None):
             # Should raise ValueError
             with pytest.raises(ValueError, match="Error loading schema"):
                 registry.get_schema("1_30_0")
@@ -78,36 +78,34 @@ def test_parse_version_with_shorter_requested_version():
                 assert result == "1_30_0"
                 
                 
-def test_custom_schema_path_loading_precedence():
+def test_custom_schema_path_loading_precedence(tmp_path):
     """Test that custom schema paths take precedence over built-in paths."""
-    # Create a registry with a custom path
-    registry = SchemaRegistry("/custom/path")
-    
-    # Set up paths for the registry
-    
-    # Set up the registry with our test paths
-    registry._custom_schemas_dir = "/custom/path"
-    registry._builtin_schemas_dir = "/builtin/path"
-    
-    # Mock functions to simulate both paths existing
-    with patch('os.path.exists', return_value=True):
-        # Mock schema loading to track which path is tried first
-        called_paths = []
-
-        def track_schema_loading(path, version, source_type):
-            called_paths.append((path, source_type))
-            # Always succeed
-            registry.schemas[version] = {"test": "schema"}
-            return True
-
-        with patch.object(registry, "schema_exists", return_value=True):
-            with patch.object(registry, "_load_schema_from_path", side_effect=track_schema_loading):
-                # Get the schema - should try custom path first
-                registry.get_schema("1_30_0")
+    # Create the same version in both a custom and a built-in directory
+    for source in ("custom", "builtin"):
+        version_dir = tmp_path / source / "1_30_0"
+        version_dir.mkdir(parents=True)
+        (version_dir / "openapi.yaml").write_text("openapi: 3.0.0\n")
+
+    registry = SchemaRegistry(str(tmp_path / "custom"))
+    registry._builtin_schemas_dir = str(tmp_path / "builtin")
+
+    # Mock schema loading to track which path is tried first
+    called_paths = []
+
+    def track_schema_loading(path, version, source_type):
+        called_paths.append((path, source_type))
+        # Always succeed
+        registry.schemas[version] = {"test": "schema"}
+        return registry.schemas[version]
+
+    with patch.object(registry, "_load_schema_from_path", side_effect=track_schema_loading):
+        # Get the schema - should try custom path first
+        registry.get_schema("1_30_0")
 
-                # Verify custom was tried first
-                assert len(called_paths) >= 1
-                assert called_paths[0][1] == "custom"  # First call should be to custom path
+        # Verify custom was tried first
+        assert len(called_paths) >= 1
+        assert called_paths[0][1] == "custom"  # First call should be to custom path
+        assert called_paths[0][0].startswith(str(tmp_path / "custom"))
 
 
 def test_find_schema_with_no_valid_versions():
@@ -6,14 +6,30 @@ various formats of schema names (simple vs fully qualified paths).
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 from otg_mcp.client import OtgClient
+from otg_mcp.config import Config
 
+_CONFIG = Config()
 
-@pytest.fixture
+
+async def _target_config(target_name):
+    """Stand in for OtgClient._get_target_config with a fixed API version."""
+    return {"apiVersion": "1.30.0"}
+
+
+def _assert_schemas(result, names):
+    """Assert that every requested name maps to a schema object."""
+    assert set(names) <= result.keys()
+    # The mock registry returns plain dicts, which must be passed through unwrapped
+    assert all(type(result[name]) is dict for name in names)
+    assert all("description" in result[name] for name in names)
+
+
+@pytest.fixture(scope="module")
 def mock_schema_registry():
-    """Create a mock schema registry for testing."""
+    """Create a mock schema registry shared by the tests in this module."""
     mock_registry = MagicMock()
     # Setup schema content for different schema names
     mock_registry.get_schema.side_effect = lambda version, component=None: {
@@ -22,90 +38,40 @@ def mock_schema_registry():
     return mock_registry
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(mock_schema_registry):
-    """Create a client instance for testing with a mock schema registry."""
-    from otg_mcp.config import Config
-    mock_config = Config()
-    return OtgClient(config=mock_config, schema_registry=mock_schema_registry)
-
-
-@pytest.mark.asyncio
-async def test_get_schemas_simple_names(client, mock_schema_registry):
-    """Test retrieving schemas using simple names like 'Flow', 'Port'."""
-    # Setup mocks with AsyncMock
-    client._get_target_config = AsyncMock(return_value={"apiVersion": "1.30.0"})
-
-    # Call the method with simple names
-    result = await client.get_schemas_for_target("test-target", ["Flow", "Port", "Config"])
-
-    # Verify the result contains the requested schemas
-    assert "Flow" in result
-    assert "Port" in result
-    assert "Config" in result
-    
-    # Verify the schemas are valid objects
-    assert isinstance(result["Flow"], dict)
-    assert isinstance(result["Port"], dict)
-    assert isinstance(result["Config"], dict)
-    
-    # Verify description exists in schemas
-    assert "description" in result["Flow"]
-    assert "description" in result["Port"]
-    assert "description" in result["Config"]
-
-
-@pytest.mark.asyncio
-async def test_get_schemas_qualified_names(client, mock_schema_registry):
-    """Test retrieving schemas using fully qualified paths."""
-    # Setup mocks with AsyncMock
-    client._get_target_config = AsyncMock(return_value={"apiVersion": "1.30.0"})
-
-    # Call the method with qualified names
-    result = await client.get_schemas_for_target(
-        "test-target", 
-        ["components.schemas.Flow", "components.schemas.Port", "components.schemas.Config"]
-    )
-
-    # Verify the result contains the requested schemas
-    assert "components.schemas.Flow" in result
-    assert "components.schemas.Port" in result
-    assert "components.schemas.Config" in result
-    
-    # Verify the schemas are valid objects
-    assert isinstance(result["components.schemas.Flow"], dict)
-    assert isinstance(result["components.schemas.Port"], dict)
-    assert isinstance(result["components.schemas.Config"], dict)
-
-
-@pytest.mark.asyncio
-async def test_get_schemas_mixed_format(client, mock_schema_registry):
-    """Test retrieving schemas using both simple and fully qualified names."""
-    # Setup mocks with AsyncMock
-    client._get_target_config = AsyncMock(return_value={"apiVersion": "1.30.0"})
-
-    # Call the method with mixed format names
-    result = await client.get_schemas_for_target(
-        "test-target", 
-        ["Flow", "components.schemas.Port", "Config"]
-    )
-
-    # Verify the result contains all requested schemas
-    assert "Flow" in result
-    assert "components.schemas.Port" in result
-    assert "Config" in result
-    
-    # Verify the schemas are valid objects
-    assert isinstance(result["Flow"], dict)
-    assert isinstance(result["components.schemas.Port"], dict)
-    assert isinstance(result["Config"], dict)
-
-
-@pytest.mark.asyncio
-async def test_schema_not_found_handling(client, mock_schema_registry):
+    """Create one client for the module; tests patch it through monkeypatch."""
+    return OtgClient(config=_CONFIG, schema_registry=mock_schema_registry)
+
+
+SIMPLE = ("Flow", "Port", "Config")
+QUALIFIED = (
+    "components.schemas.Flow",
+    "components.schemas.Port",
+    "components.schemas.Config",
+)
+MIXED = ("Flow", "components.schemas.Port", "Config")
+
+CASES = [
+    pytest.param(SIMPLE, id="simple"),
+    pytest.param(QUALIFIED, id="qualified"),
+    pytest.param(MIXED, id="mixed"),
+]
+
+
+@pytest.mark.parametrize("schema_names", CASES)
+async def test_get_schemas(client, mock_schema_registry, monkeypatch, schema_names):
+    """Test retrieving schemas by simple, fully qualified and mixed names."""
+    monkeypatch.setattr(client, "_get_target_config", _target_config)
+
+    result = await client.get_schemas_for_target("test-target", list(schema_names))
+
+    _assert_schemas(result, schema_names)
+
+
+async def test_schema_not_found_handling(client, mock_schema_registry, monkeypatch):
     """Test handling of non-existent schemas."""
-    # Setup mocks with AsyncMock
-    client._get_target_config = AsyncMock(return_value={"apiVersion": "1.30.0"})
+    monkeypatch.setattr(client, "_get_target_config", _target_config)
 
     # Configure mock to raise an exception for a non-existent schema
     def mock_get_schema(version, component=None):
@@ -113,7 +79,7 @@ async def test_schema_not_found_handling(client, mock_schema_registry):
             raise ValueError("Schema not found")
         return {"description": f"Mock schema for {component or 'all'}"}
 
-    mock_schema_registry.get_schema.side_effect = mock_get_schema
+    monkeypatch.setattr(mock_schema_registry.get_schema, "side_effect", mock_get_schema)
 
     # Call the method with a non-existent schema
     result = await client.get_schemas_for_target("test-target", ["NonExistentSchema"])
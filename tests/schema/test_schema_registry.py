@@ -3,8 +3,6 @@ Unit tests for the schema registry functionality.
 """
 
 import os
-import shutil
-import tempfile
 
 import pytest
 import yaml
@@ -16,10 +14,9 @@ class TestSchemaRegistry:
     """Test case for the SchemaRegistry class."""
 
     @pytest.fixture
-    def mock_schemas_dir(self):
+    def mock_schemas_dir(self, tmp_path):
         """Create a temporary directory with mock schema files."""
-        # Create a temporary directory
-        temp_dir = tempfile.mkdtemp()
+        temp_dir = str(tmp_path)
 
         # Create schema version directories
         v1_dir = os.path.join(temp_dir, "1_30_0")
@@ -68,10 +65,7 @@ class TestSchemaRegistry:
         with open(os.path.join(v2_dir, "openapi.yaml"), "w") as f:
             yaml.dump(v2_schema, f)
 
-        yield temp_dir
-
-        # Cleanup the temporary directory
-        shutil.rmtree(temp_dir)
+        return temp_dir
 
     def test_available_schemas(self, mock_schemas_dir):
         """Test getting available schemas."""
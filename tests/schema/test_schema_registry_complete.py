@@ -6,23 +6,20 @@ with special attention to error cases and edge conditions.
 """
 
 import os
-import shutil
-import tempfile
 
 import pytest
 import yaml
 
-from otg_mcp.schema_registry import SchemaRegistry
+from otg_mcp.schema_registry import SchemaRegistry, _normalize_version
 
 
 class TestSchemaRegistryComplete:
     """Test cases for 100% coverage of SchemaRegistry."""
 
     @pytest.fixture
-    def mock_schemas_dir(self):
+    def mock_schemas_dir(self, tmp_path):
         """Create a temporary directory with mock schema files."""
-        # Create a temporary directory
-        temp_dir = tempfile.mkdtemp()
+        temp_dir = str(tmp_path)
 
         # Create schema version directories
         v1_dir = os.path.join(temp_dir, "1_30_0")
@@ -66,16 +63,12 @@ class TestSchemaRegistryComplete:
         with open(os.path.join(v2_dir, "openapi.yaml"), "w") as f:
             yaml.dump(v2_schema, f)
 
-        yield temp_dir
-
-        # Cleanup the temporary directory
-        shutil.rmtree(temp_dir)
+        return temp_dir
 
     def test_normalize_version(self):
         """Test version string normalization."""
-        registry = SchemaRegistry()
-        assert registry._normalize_version("1.30.0") == "1_30_0"
-        assert registry._normalize_version("1_30_0") == "1_30_0"
+        assert _normalize_version("1.30.0") == "1_30_0"
+        assert _normalize_version("1_30_0") == "1_30_0"
 
     def test_get_available_schemas(self, mock_schemas_dir):
         """Test getting available schemas."""
@@ -95,22 +88,19 @@ class TestSchemaRegistryComplete:
         cached_schemas = registry.get_available_schemas()
         assert cached_schemas == schemas
 
-    def test_non_existent_schemas_dir(self):
+    def test_non_existent_schemas_dir(self, tmp_path):
         """Test behavior when schemas directory doesn't exist."""
         registry = SchemaRegistry()
-        temp_dir = tempfile.mkdtemp()
-        try:
-            # Point to a non-existent directory
-            non_existent_dir = os.path.join(temp_dir, "non_existent")
-            registry._builtin_schemas_dir = non_existent_dir
-            registry._available_schemas = None
-            
-            # Should handle non-existent directory gracefully
-            schemas = registry.get_available_schemas()
-            # We expect empty list from built-in, but might have default schemas still
-            assert isinstance(schemas, list)
-        finally:
-            shutil.rmtree(temp_dir)
+
+        # Point to a non-existent directory
+        non_existent_dir = os.path.join(tmp_path, "non_existent")
+        registry._builtin_schemas_dir = non_existent_dir
+        registry._available_schemas = None
+
+        # Should handle non-existent directory gracefully
+        schemas = registry.get_available_schemas()
+        # We expect empty list from built-in, but might have default schemas still
+        assert isinstance(schemas, list)
 
     def test_schema_exists(self, mock_schemas_dir):
         """Test checking if schemas exist."""
@@ -147,7 +137,7 @@ class TestSchemaRegistryComplete:
         
         # Test with a path that returns a non-dict
         components = registry.get_schema_components("1.30.0", "components.schemas.Device")
-        assert components == []
+        assert components == ()
 
     def test_get_schema_basic(self, mock_schemas_dir):
         """Test getting a basic schema."""
@@ -173,27 +163,21 @@ class TestSchemaRegistryComplete:
             registry.get_schema("non_existent")
         assert "not found" in str(excinfo.value)
 
-    def test_get_schema_loading_exception(self):
+    def test_get_schema_loading_exception(self, tmp_path):
         """Test exception during schema loading."""
         registry = SchemaRegistry()
-        
+
         # Create a temporary directory with an invalid YAML file
-        temp_dir = tempfile.mkdtemp()
-        try:
-            v1_dir = os.path.join(temp_dir, "1_30_0")
-            os.makedirs(v1_dir)
-            
-            with open(os.path.join(v1_dir, "openapi.yaml"), "w") as f:
-                f.write("invalid YAML content:\n\tindentation error")
-            
-            registry._builtin_schemas_dir = temp_dir
-            registry._available_schemas = None  # Force refresh
-            
-            with pytest.raises(ValueError) as excinfo:
-                registry.get_schema("1.30.0")
-            assert "Error loading schema" in str(excinfo.value)
-        finally:
-            shutil.rmtree(temp_dir)
+        v1_dir = tmp_path / "1_30_0"
+        v1_dir.mkdir()
+        (v1_dir / "openapi.yaml").write_text("invalid YAML content:\n\tindentation error")
+
+        registry._builtin_schemas_dir = str(tmp_path)
+        registry._available_schemas = None  # Force refresh
+
+        with pytest.raises(ValueError) as excinfo:
+            registry.get_schema("1.30.0")
+        assert "Error loading schema" in str(excinfo.value)
 
     def test_get_schema_component_special_handling(self, mock_schemas_dir):
         """Test special handling for components.schemas.X paths."""
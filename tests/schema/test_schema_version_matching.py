@@ -6,13 +6,11 @@ version when an exact match isn't available.
 """
 
 import os
-import shutil
-import tempfile
 from unittest.mock import patch
 
 import pytest
 
-from otg_mcp.schema_registry import SchemaRegistry
+from otg_mcp.schema_registry import SchemaRegistry, _normalize_version
 
 
 def test_schema_exists():
@@ -25,9 +23,8 @@ def test_schema_exists():
 
 def test_normalize_version():
     """Test version normalization."""
-    registry = SchemaRegistry()
-    assert registry._normalize_version("1.30.0") == "1_30_0"
-    assert registry._normalize_version("1_30_0") == "1_30_0"
+    assert _normalize_version("1.30.0") == "1_30_0"
+    assert _normalize_version("1_30_0") == "1_30_0"
 
 
 class TestVersionMatching:
@@ -77,10 +74,11 @@ class TestVersionMatching:
 class TestCustomSchemaPaths:
     """Tests for custom schema path functionality."""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def schema_dirs(self, tmp_path):
         """Set up the test environment with temporary directories."""
         # Create temporary directories for custom and built-in schemas
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = str(tmp_path)
         self.custom_dir = os.path.join(self.temp_dir, "custom_schemas")
         os.makedirs(self.custom_dir)
         
@@ -92,10 +90,6 @@ class TestCustomSchemaPaths:
         with open(os.path.join(self.custom_schema_dir, "openapi.yaml"), "w") as f:
             f.write("# Custom schema 1.31.0")
     
-    def teardown_method(self):
-        """Clean up temporary directories."""
-        shutil.rmtree(self.temp_dir)
-    
     def test_custom_schemas_directory(self):
         """Test that custom schemas directory is used."""
         registry = SchemaRegistry(self.custom_dir)
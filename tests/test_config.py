@@ -1,9 +1,11 @@
+import logging
 import os
 from unittest import mock
 
 import pytest
 
 from otg_mcp.config import (
+    Config,
     LoggingConfig,
 )
 
@@ -42,3 +44,37 @@ class TestConfig:
             mock_socket_instance = mock.MagicMock()
             mock_socket.return_value.__enter__.return_value = mock_socket_instance
             yield mock_socket_instance
+
+    def test_missing_config_file(self, tmp_path):
+        """Test that a missing config file raises FileNotFoundError."""
+        missing = tmp_path / "missing.json"
+        with pytest.raises(FileNotFoundError, match="Configuration file not found"):
+            Config(str(missing))
+
+    def test_unreadable_config_file(self, tmp_path, caplog):
+        """Test that read errors other than a missing file are logged critically."""
+        with caplog.at_level(logging.CRITICAL, logger="otg_mcp.config"):
+            with pytest.raises(IsADirectoryError):
+                Config(str(tmp_path))
+        assert "Error loading configuration" in caplog.text
+
+    def test_setup_logging_is_idempotent(self):
+        """Test that repeated setup_logging calls install a single handler."""
+        root_logger = logging.getLogger()
+        saved_handlers = root_logger.handlers[:]
+        saved_level = root_logger.level
+        embedder_handler = logging.NullHandler()
+        root_logger.addHandler(embedder_handler)
+        try:
+            config = Config()
+            config.setup_logging()
+            config.setup_logging()
+            added = [h for h in root_logger.handlers if h not in saved_handlers]
+            assert added == [embedder_handler, config._log_handler]
+            assert root_logger.level == logging.INFO
+        finally:
+            for handler in root_logger.handlers[:]:
+                root_logger.removeHandler(handler)
+            for handler in saved_handlers:
+                root_logger.addHandler(handler)
+            root_logger.setLevel(saved_level)
@@ -1,8 +1,10 @@
 """Tests for the health check functionality in the OTG client."""
 
+import asyncio
 import logging
 import pytest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from otg_mcp.client import OtgClient
 from otg_mcp.models import CapabilitiesVersionResponse
@@ -10,26 +12,28 @@ from otg_mcp.models import CapabilitiesVersionResponse
 logger = logging.getLogger(__name__)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_config():
-    """Create a mocked config."""
-    # Create a mock TargetsConfig to hold the targets dict
-    targets_config = MagicMock()
-    targets_config.targets = {
-        "target1": MagicMock(),
-        "target2": MagicMock(),
-    }
-
-    # Create the main Config mock with the targets attribute
-    config = MagicMock()
-    config.targets = targets_config
-
-    return config
+    """Create a mocked config shared by the tests in this module."""
+    # Plain namespaces hold the handful of attributes the client reads
+    return SimpleNamespace(
+        schemas=SimpleNamespace(schema_path=None),
+        targets=SimpleNamespace(
+            targets={
+                "target1": SimpleNamespace(ports={}),
+                "target2": SimpleNamespace(ports={}),
+            }
+        ),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(mock_config):
-    """Create client with mocked config."""
+    """Create client with mocked config shared by the tests in this module.
+
+    Each test patches the client methods it needs with patch.object, which
+    restores them when the test ends.
+    """
     return OtgClient(mock_config)
 
 
@@ -41,12 +45,7 @@ async def test_health_all_healthy(client):
         api_spec_version="1.*", sdk_version="1.28.2", app_version="1.28.0"
     )
 
-    # Mock the get_available_targets method to avoid it making internal get_target_version calls
-    mock_targets = {"target1": {}, "target2": {}}
-
     with patch.object(
-        client, "get_available_targets", return_value=mock_targets
-    ), patch.object(
         client, "get_target_version", return_value=mock_version_info
     ) as mock_get_version:
         # Act
@@ -59,6 +58,53 @@ async def test_health_all_healthy(client):
         assert mock_get_version.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_health_checks_targets_concurrently(client):
+    """Test that all targets are probed at the same time."""
+    mock_version_info = CapabilitiesVersionResponse(
+        api_spec_version="1.*", sdk_version="1.28.2", app_version="1.28.0"
+    )
+    started = []
+    all_started = asyncio.Event()
+
+    async def mock_get_target_version(target):
+        started.append(target)
+        if len(started) == 2:
+            all_started.set()
+        # Each probe only finishes once the other one has started
+        await asyncio.wait_for(all_started.wait(), timeout=1)
+        return mock_version_info
+
+    with patch.object(
+        client, "get_target_version", side_effect=mock_get_target_version
+    ):
+        result = await client.health()
+
+    assert result.status == "success"
+    assert list(result.targets) == ["target1", "target2"]
+
+
+@pytest.mark.asyncio
+async def test_health_probes_each_target_once_and_keeps_target_cache(client):
+    """Test that a full health check probes each target once and keeps caches."""
+    mock_version_info = CapabilitiesVersionResponse(
+        api_spec_version="1.*", sdk_version="1.28.2", app_version="1.28.0"
+    )
+    cached_entry = (0.0, {"apiVersion": "1.28.2", "ports": {}})
+
+    with patch.dict(client.target_configs, {"target1": cached_entry}), patch.object(
+        client, "get_target_version", return_value=mock_version_info
+    ) as mock_get_version:
+        result = await client.health()
+
+        assert result.status == "success"
+        assert sorted(call.args[0] for call in mock_get_version.call_args_list) == [
+            "target1",
+            "target2",
+        ]
+        assert client.target_configs["target1"] is cached_entry
+
+
 @pytest.mark.asyncio
 async def test_health_one_unhealthy(client):
     """Test health check when one target is unhealthy."""
@@ -146,7 +192,7 @@ async def test_health_exception(client):
     """Test health check when an unexpected exception occurs."""
     # Arrange
     with patch.object(
-        client, "get_available_targets", side_effect=Exception("Unexpected error")
+        client, "_check_target_health", side_effect=Exception("Unexpected error")
     ):
         # Act
         result = await client.health()
@@ -1,16 +1,7 @@
-from unittest import mock
-
 import pytest
+from pydantic import ValidationError
 
 from otg_mcp.models import HealthStatus, TargetHealthInfo
-from otg_mcp.server import FastMCP
-
-
-@pytest.fixture
-def mock_fastmcp():
-    """Mock FastMCP for testing."""
-    mock_mcp = mock.MagicMock(spec=FastMCP)
-    return mock_mcp
 
 
 class TestOtgMcpServer:
@@ -19,9 +10,9 @@ class TestOtgMcpServer:
     def test_health_check_tool(self):
         """Test the health check tool."""
         # Simplify the test - we just want to verify that a health status
-        # object has the expected properties
-        target_info = TargetHealthInfo(name="target1", healthy=True)
-        health_status = HealthStatus(
+        # object has the expected properties, so skip validation here
+        target_info = TargetHealthInfo.model_construct(name="target1", healthy=True)
+        health_status = HealthStatus.model_construct(
             status="success",
             targets={"target1": target_info}
         )
@@ -31,3 +22,14 @@ class TestOtgMcpServer:
         assert "target1" in health_status.targets
         assert health_status.targets["target1"].name == "target1"
         assert health_status.targets["target1"].healthy
+
+    def test_health_status_validation(self):
+        """Test that health status validation rejects incomplete target info."""
+        health_status = HealthStatus.model_validate(
+            {"targets": {"target1": {"name": "target1", "healthy": True}}}
+        )
+        assert health_status.status == "success"
+        assert isinstance(health_status.targets["target1"], TargetHealthInfo)
+
+        with pytest.raises(ValidationError, match="healthy"):
+            HealthStatus.model_validate({"targets": {"target1": {"name": "target1"}}})
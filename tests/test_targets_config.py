@@ -36,6 +36,23 @@ class TestTargetConfig:
         assert port2.location == "eth1"
         assert port2.name == "eth1"
 
+    def test_port_config_defaults(self):
+        """Test PortConfig fills location and name from the other fields."""
+        # Interface only: location and name fall back to the interface
+        port = PortConfig(interface="eth0")
+        assert port.location == "eth0"
+        assert port.name == "eth0"
+
+        # Location only: name falls back to the location
+        port = PortConfig(location="localhost:5555")
+        assert port.location == "localhost:5555"
+        assert port.name == "localhost:5555"
+
+        # Explicit values are left untouched
+        port = PortConfig(interface="eth0", location="eth1", name="p1")
+        assert port.location == "eth1"
+        assert port.name == "p1"
+
     def test_target_config_model(self):
         """Test TargetConfig Pydantic model."""
         # Create a target config with ports
@@ -0,0 +1,63 @@
+"""
+Tests for apiVersion handling in target configuration.
+
+The API version is always detected from the target device, so it must not
+appear in the target configuration itself.
+"""
+
+import json
+
+import pytest
+
+from otg_mcp.config import Config, TargetConfig
+
+_PORTS = {"p1": {"location": "localhost:5555", "name": "p1"}}
+
+
+def _write_config(tmp_path, targets):
+    """Write a config file with the given targets and return its path."""
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"targets": targets}, separators=(",", ":")))
+    return str(config_file)
+
+
+def test_target_config_rejects_api_version():
+    """Test that TargetConfig does not accept an apiVersion field."""
+    target_data = {"apiVersion": "1.30.0", "ports": _PORTS}
+
+    with pytest.raises(
+        ValueError, match=r"(?s)apiVersion.*Extra inputs are not permitted"
+    ):
+        TargetConfig(**target_data)
+
+    # The same target without apiVersion is valid
+    target = TargetConfig.model_validate({"ports": _PORTS})
+    assert target.ports["p1"].location == "localhost:5555"
+
+
+def test_config_file_with_api_version(tmp_path):
+    """Test that targets with apiVersion in a config file are skipped."""
+    config = Config(
+        _write_config(
+            tmp_path,
+            {
+                "bad-target:8443": {"apiVersion": "1.30.0", "ports": _PORTS},
+                "good-target:8443": {"ports": _PORTS},
+            },
+        )
+    )
+
+    assert "bad-target:8443" not in config.targets.targets
+    assert "good-target:8443" in config.targets.targets
+
+
+def test_config_file_without_api_version(tmp_path):
+    """Test that a config file without any apiVersion loads every target."""
+    config = Config(
+        _write_config(
+            tmp_path,
+            {"target-1:8443": {"ports": _PORTS}, "target-2:8443": {"ports": _PORTS}},
+        )
+    )
+
+    assert len(config.targets.targets) == 2
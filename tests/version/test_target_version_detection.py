@@ -15,25 +15,33 @@ from otg_mcp.models import CapabilitiesVersionResponse
 
 @pytest.fixture
 def client():
-    """Create a client instance for testing."""
-    from otg_mcp.config import Config
+    """Create a client with test targets configured and no network access."""
+    from otg_mcp.config import Config, TargetConfig
     mock_config = Config()
-    return OtgClient(config=mock_config)
+    for target_name in ("test-target", "other-target"):
+        mock_config.targets.targets[target_name] = TargetConfig()
+    client = OtgClient(config=mock_config)
+    client._get_api_client = MagicMock()
+    return client
+
+
+@pytest.fixture
+def detecting_client(client):
+    """Create a client whose targets report 1.30.0, a version with a schema."""
+    client.get_target_version = AsyncMock(return_value=CapabilitiesVersionResponse(
+        api_spec_version="1.*",
+        sdk_version="1.30.0",
+        app_version="1.0.0"
+    ))
+    mock_registry = MagicMock()
+    mock_registry.schema_exists.return_value = True
+    client.schema_registry = mock_registry
+    return client
 
 
 @pytest.mark.asyncio
 async def test_target_version_detection_uses_actual_version(client):
     """Test that client uses the actual target version when it has a matching schema."""
-    # Setup mocks
-    # Mock get_available_targets to return a target with a detected version
-    client.get_available_targets = AsyncMock(return_value={
-        "test-target": {
-            "apiVersion": "1.30.0",  # Previously detected version (from device)
-            "available": True,
-            "ports": {}
-        }
-    })
-    
     # Mock get_target_version to return a different version
     client.get_target_version = AsyncMock(return_value=CapabilitiesVersionResponse(
         api_spec_version="1.*",     # API spec version
@@ -62,16 +70,6 @@ async def test_target_version_detection_uses_actual_version(client):
 @pytest.mark.asyncio
 async def test_target_version_detection_fallback_to_latest_version(client):
     """Test that client falls back to latest schema version when actual version has no schema."""
-    # Setup mocks
-    # Mock get_available_targets to return a target with a basic config
-    client.get_available_targets = AsyncMock(return_value={
-        "test-target": {
-            "apiVersion": "unknown",  # Initial placeholder
-            "available": True,
-            "ports": {}
-        }
-    })
-    
     # Mock get_target_version to return a version we don't have a schema for
     client.get_target_version = AsyncMock(return_value=CapabilitiesVersionResponse(
         api_spec_version="1.*",     # API spec version
@@ -103,15 +101,6 @@ async def test_target_version_detection_fallback_to_latest_version(client):
 @pytest.mark.asyncio
 async def test_target_version_detection_handles_exceptions(client):
     """Test that client handles exceptions when getting target version."""
-    # Setup mocks
-    # Mock get_available_targets to return a target with minimal config
-    client.get_available_targets = AsyncMock(return_value={
-        "test-target": {
-            "available": True,
-            "ports": {}
-        }
-    })
-    
     # Mock get_target_version to raise an exception
     client.get_target_version = AsyncMock(side_effect=Exception("Connection failed"))
     
@@ -129,3 +118,59 @@ async def test_target_version_detection_handles_exceptions(client):
     assert target_config is not None
     assert target_config["apiVersion"] == "1.30.0"  # Should use latest version (1_30_0 → 1.30.0)
     mock_registry.get_latest_schema_version.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_target_config_cached_after_version_detection(detecting_client):
+    """Test that a detected target configuration is reused while it is fresh."""
+    first = await detecting_client._get_target_config("test-target")
+    second = await detecting_client._get_target_config("test-target")
+
+    assert second is first
+    assert second["apiVersion"] == "1.30.0"
+    detecting_client._get_api_client.assert_called_once()
+    detecting_client.get_target_version.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_target_config_not_cached_when_version_detection_fails(client):
+    """Test that a fallback API version is not cached."""
+    client.get_target_version = AsyncMock(side_effect=Exception("Connection failed"))
+    mock_registry = MagicMock()
+    mock_registry.get_latest_schema_version.return_value = "1_30_0"
+    client.schema_registry = mock_registry
+
+    await client._get_target_config("test-target")
+    await client._get_target_config("test-target")
+
+    assert "test-target" not in client.target_configs
+    assert client.get_target_version.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_target_config_cache_is_per_target(detecting_client):
+    """Test that looking up one target doesn't evict another target's config."""
+    for _ in range(5):
+        await detecting_client._get_target_config("test-target")
+        await detecting_client._get_target_config("other-target")
+
+    assert set(detecting_client.target_configs) == {"test-target", "other-target"}
+    assert detecting_client.get_target_version.await_count == 2
+    assert detecting_client._get_api_client.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_target_config_cache_expires(detecting_client):
+    """Test that a cached target configuration is re-probed after its TTL."""
+    await detecting_client._get_target_config("test-target")
+    await detecting_client._get_target_config("test-target")
+    assert detecting_client.get_target_version.await_count == 1
+
+    # Age the cached entry past the TTL
+    cached_at, cached_config = detecting_client.target_configs["test-target"]
+    detecting_client.target_configs["test-target"] = (
+        cached_at - detecting_client.target_config_ttl,
+        cached_config,
+    )
+    await detecting_client._get_target_config("test-target")
+    assert detecting_client.get_target_version.await_count == 2